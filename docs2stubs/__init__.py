@@ -84,15 +84,15 @@ def main():
         dump_all = not arguments['--skip-trivial']
         trace_folder = arguments['--trace_folder']  
         init_trace_loader(trace_folder, n)
-        analyze_module(n, output_trivial_types=dump_all)
+        analyze_module(n, output_trivial_types=dump_all, trace_folder=trace_folder)
       elif arguments['stub']:
         strip_defaults = arguments['--strip-defaults']
         skip_analysis = arguments['--skip-analysis']
         stub_folder = arguments['--stub_folder']
         trace_folder = arguments['--trace_folder']
         init_trace_loader(trace_folder, n)
-        stub_module(n, strip_defaults=strip_defaults, skip_analysis=skip_analysis, 
-                    stub_folder=stub_folder)
+        stub_module(n, strip_defaults=strip_defaults, skip_analysis=skip_analysis,
+                    stub_folder=stub_folder, trace_folder=trace_folder)
       elif arguments['test']:
         print(check_normalizer(arguments["<typestring>"], name))
 
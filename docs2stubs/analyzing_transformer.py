@@ -1,5 +1,11 @@
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import importlib
+import inspect
+import io
 import logging
+import os
 from types import ModuleType
 from typing import  cast
 import libcst as cst
@@ -9,7 +15,6 @@ from .base_transformer import BaseTransformer
 from .utils import Sections, State, analyze_object, \
     collect_modules, get_top_level_obj, \
     load_type_maps, save_docstrings, save_result
-from .docstring_parser import NumpyDocstringParser
 from .traces import init_trace_loader, get_method_signature, get_toplevel_function_signature
 from .type_normalizer import is_trivial, normalize_type, print_norm1
 
@@ -30,7 +35,6 @@ class AnalyzingTransformer(BaseTransformer):
         """
         super().__init__(modname, fname)
         self._mod = mod
-        self._parser = NumpyDocstringParser()
 
         self._docs: dict[str, Sections[dict[str,str]|None]] = {}
         self._classname = None  # Current class we are in, if any
@@ -47,25 +51,31 @@ class AnalyzingTransformer(BaseTransformer):
         self._state = state
         assert(state.counters is not None)
         self._counters = state.counters
+        # Per-section buffers of docstring types seen during the traversal;
+        # they are counted in one batch in leave_Module.
+        self._pending = Sections[list[str]](params=[], returns=[], attrs=[])
 
     def _get_obj_name(self, obj) -> str:
-        rtn = str(obj)
-        if rtn.startswith('<class '):
-            # Something like <class 'sklearn.preprocessing._discretization.KBinsDiscretizer'>
-            return rtn[rtn.find(' ')+2:-2]
-        elif rtn.startswith('<classmethod'):
-            # Something like <classmethod(<function DistanceMetric.get_metric at 0x1277800d0>)>
-            return rtn[rtn.find('.')+1:].split(' ')[0]
-        elif rtn.find(' ') > 0:
-            # Something like <function KBinsDiscretizer.__init__ at 0x169e70430>
-            return rtn.split(' ')[1]
+        # Dispatch on the object type directly rather than stringizing it
+        # and scanning the repr.
+        if inspect.isclass(obj):
+            # Was <class 'sklearn.preprocessing._discretization.KBinsDiscretizer'>
+            return f'{obj.__module__}.{obj.__qualname__}'
+        elif isinstance(obj, classmethod):
+            # Was <classmethod(<function DistanceMetric.get_metric at 0x1277800d0>)>
+            return obj.__func__.__name__
+        elif callable(obj):
+            # Was <function KBinsDiscretizer.__init__ at 0x169e70430>
+            return getattr(obj, '__qualname__', str(obj))
         else:
-            return rtn
+            return str(obj)
 
-    def _update_fullmap(self, section, items, context) -> None:
+    def _update_fullmap(self, section, items, prefix: str) -> None:
+        # prefix is the context with a trailing '.', computed once by the
+        # caller; str + str beats an f-string in this inner loop.
         if items:
             for name, typ in items.items():
-                section[f'{context}.{name}'] = typ
+                section[prefix + name] = typ
 
     def visit_ClassDef(self, node: cst.ClassDef) -> bool:
         self._traced_methodsig = None
@@ -74,7 +84,7 @@ class AnalyzingTransformer(BaseTransformer):
             self._classname = node.name.value
             context = self.context()
             obj = get_top_level_obj(self._mod, self._fname, node.name.value)
-            docs = analyze_object(obj, context, self._parser, self._counters, self._attrtyps)
+            docs = analyze_object(obj, context, self._pending, self._attrtyps)
             self._docs[context] = docs
         return rtn
 
@@ -101,7 +111,7 @@ class AnalyzingTransformer(BaseTransformer):
                 else:
                     logging.warning(f'{self._fname}: Could not get obj for {context}')
 
-        docs = analyze_object(obj, context, self._parser, self._counters, self._attrtyps)
+        docs = analyze_object(obj, context, self._pending, self._attrtyps)
         self._docs[context] = docs
         if name == '__init__':
             # If we actually had a docstring with params section, we're done
@@ -140,44 +150,108 @@ class AnalyzingTransformer(BaseTransformer):
                     self._paramtyps[self.context()] = ptype
         return rtn
 
+    def leave_Module(self, original_node: cst.Module, updated_node: cst.Module) -> cst.Module:
+        # Count the buffered docstring types in one C-level pass per section.
+        for buffer, counter in zip(self._pending, self._counters):
+            cast(Counter[str], counter).update(cast(list, buffer))
+        return updated_node
+
+
+@lru_cache(maxsize=128)
+def parse_module_cached(source: str) -> cst.Module:
+    """ Parse a module's source with libcst, memoized on the source text so
+        re-analyzing unchanged files within a session skips the parse.
+    """
+    return cst.parse_module(source)
+
+
+def _analyze_file(task: tuple[str, str, str]) -> State|None:
+    """ Analyze a single file in a worker process. The module is re-imported
+        by name here rather than passed in, as module objects can't be pickled
+        across process boundaries. Returns a State holding just this file's
+        counters, docstrings and trace signatures, to be merged by the parent.
+    """
+    module_name, file_name, trace_folder = task
+    init_trace_loader(trace_folder, module_name)
+    try:
+        mod = importlib.import_module(module_name)
+    except Exception as e:
+        logging.error(f"Analyzing: Failed to import {module_name}: {e}")
+        return None
+    try:
+        with open(file_name) as f:
+            source_code = f.read()
+    except Exception as e:
+        logging.error(f"Analyzing: Failed to read {file_name}: {e}")
+        return None
+    state = State(
+        Sections[Counter[str]](params=Counter(), returns=Counter(), attrs=Counter()),
+        {},
+        None,
+        {},
+        {},
+        {},
+        {}
+    )
+    try:
+        cstree = parse_module_cached(source_code)
+    except Exception as e:
+        logging.error(f"Failed to parse file: {file_name}: {e}")
+        return None
+    try:
+        cstree.visit(AnalyzingTransformer(mod, module_name, file_name, state))
+    except Exception as e:
+        logging.error(f"Failed to analyze file: {file_name}: {e}")
+        return None
+
+    logging.info(f"Analyzing: Done {file_name}")
+    return state
+
 
 def analyze_module(module_name: str, output_trivial_types: bool = True, trace_folder='tracing') -> State:
     logging.info("Gathering docstrings")
     state = State(
         Sections[Counter[str]](params=Counter(), returns=Counter(), attrs=Counter()),
-        {}, 
-        load_type_maps(module_name), 
-        {}, 
         {},
-        {}, 
+        load_type_maps(module_name),
+        {},
+        {},
+        {},
         {}
-    )    
+    )
     module_metadata = collect_modules("Analyzing", module_name, state)
-    while module_metadata:
-        mod, file_name, module_name = module_metadata.pop()
-        if file_name.endswith('.py'):
-            try:
-                with open(file_name) as f:
-                    source_code = f.read()
-            except Exception as e:
-                logging.error(f"Analyzing: Failed to read {file_name}: {e}")
-                continue
+    # The per-file work (CST parsing plus docstring parsing) is CPU-bound, so
+    # farm it out to a process pool and merge the per-file results back into
+    # our own state.
+    tasks = [(metadata.module_name, metadata.file_name, trace_folder)
+             for metadata in module_metadata if metadata.file_name.endswith('.py')]
+    assert(state.counters is not None)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(_analyze_file, task): task[1] for task in tasks}
+        for future in as_completed(futures):
+            file_name = futures[future]
             try:
-                cstree = cst.parse_module(source_code)
+                file_state = future.result()
             except Exception as e:
-                logging.error(f"Failed to parse file: {file_name}: {e}")
+                # A result can fail in transit even when the worker succeeded,
+                # e.g. a trace signature referencing a dynamically synthesized
+                # type that can't be pickled back to the parent. Skip the file
+                # rather than aborting the whole analysis.
+                logging.error(f"Failed to collect analysis of {file_name}: {e}")
                 continue
-            try:
-                cstree.visit(AnalyzingTransformer(mod, module_name, file_name, state))
-            except Exception as e:
-                logging.error(f"Failed to analyze file: {file_name}: {e}")
+            if file_state is None:
                 continue
-
-            logging.info(f"Analyzing: Done {file_name}")
+            assert(file_state.counters is not None)
+            for counter, file_counter in zip(state.counters, file_state.counters):
+                cast(Counter[str], counter).update(cast(Counter[str], file_counter))
+            state.docstrings.update(file_state.docstrings)
+            state.trace_sigs.update(file_state.trace_sigs)
 
     logging.info("Analyzing and normalizing types...")
     maps = load_type_maps(module_name)
-    results = [[], [], []]
+    # StringIO buffers grow in place, rather than accumulating a list of
+    # line strings that has to be joined into one large temporary at the end.
+    results = [io.StringIO(), io.StringIO(), io.StringIO()]
     assert(state.counters is not None)
     freqs: Sections[Counter[str]] = state.counters
     total_trivial = 0
@@ -201,7 +275,7 @@ def analyze_module(module_name: str, output_trivial_types: bool = True, trace_fo
                 else:
                     # We don't have a mapping for this type. Add it to the missing types.
                     total_missed += cnt
-                    result.append(f'{"@" if trivial else ""}{cnt}#{typ}#{normtype}\n')
+                    result.write(f'{"@" if trivial else ""}{cnt}#{typ}#{normtype}\n')
 
     logging.info(f'Trivial: {total_trivial}, Mapped: {total_mapped}, Missed: {total_missed}')
     logging.info('\nTRIVIALS\n')
@@ -210,7 +284,7 @@ def analyze_module(module_name: str, output_trivial_types: bool = True, trace_fo
     print_norm1()
 
     for i, section in enumerate(['params', 'returns', 'attrs']):
-        save_result(f"analysis/{module_name}.{section}.map.missing", ''.join(results[i]))
+        save_result(f"analysis/{module_name}.{section}.map.missing", results[i].getvalue())
     save_docstrings(module_name, state.docstrings)
     return state
     
@@ -19,9 +19,14 @@ class BaseTransformer(cst.CSTTransformer):
         self._in_class_count = 0
         self._in_function_count = 0
         self._context_stack = []
+        # Cache of the joined context stack; context() is called several
+        # times per visited node so we only re-join when the stack changes.
+        self._context_cache: str|None = None
 
     def context(self) -> str:
-        return '.'.join(self._context_stack)
+        if self._context_cache is None:
+            self._context_cache = '.'.join(self._context_stack)
+        return self._context_cache
 
     def in_class(self)-> bool:
         return self._in_class_count > 0
@@ -53,6 +58,7 @@ class BaseTransformer(cst.CSTTransformer):
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Entering class {node.name.value}")
         self._context_stack.append(node.name.value)
+        self._context_cache = None
         self._in_class_count += 1
         # No point recursing if we are at nested function level
         # or this is a nested class.
@@ -60,6 +66,7 @@ class BaseTransformer(cst.CSTTransformer):
 
     def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.CSTNode:
         n = self._context_stack.pop()
+        self._context_cache = None
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Leaving class {n}")
         self._in_class_count -= 1
@@ -70,6 +77,7 @@ class BaseTransformer(cst.CSTTransformer):
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Entering function {node.name.value}")
         self._context_stack.append(node.name.value)
+        self._context_cache = None
         self._in_function_count += 1
         # No point recursing if we are at nested function level
         return self._in_function_count == 1
@@ -78,6 +86,7 @@ class BaseTransformer(cst.CSTTransformer):
         self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
     ) -> cst.CSTNode:
         n = self._context_stack.pop() 
+        self._context_cache = None
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Leaving function {n}")
         self._in_function_count -= 1 
@@ -87,12 +96,14 @@ class BaseTransformer(cst.CSTTransformer):
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Entering param {node.name.value}")
         self._context_stack.append(node.name.value)
+        self._context_cache = None
         return True
 
     def leave_Param(
         self, original_node: cst.Param, updated_node: cst.Param
     ) -> cst.CSTNode:
         n = self._context_stack.pop()
+        self._context_cache = None
         if _stack_debug:
             print(f"{' '*4*len(self._context_stack)}Leaving param {n}")
         return updated_node
@@ -8,7 +8,7 @@ import libcst as cst
 from black import format_str
 from black.mode import Mode
 
-from .analyzing_transformer import analyze_module
+from .analyzing_transformer import analyze_module, parse_module_cached
 from .type_normalizer import is_trivial, normalize_type
 from .base_transformer import BaseTransformer
 from .sklearn_native import write_sklearn_native_stubs
@@ -491,7 +491,7 @@ class StubbingTransformer(BaseTransformer):
                         if n == 'self':
                             # if typ is Any (probably came from object) or the containing class, this
                             # is almost certainly a Self return.
-                            if typ == 'Any' or context.split('.')[0] == typ.split('.')[-1]:
+                            if typ == 'Any' or context.partition('.')[0] == typ.rpartition('.')[2]:
                                 typ = 'Self'
                             # else TODO: see what other cases of Self we can catch here
                         v.append(typ)
@@ -515,7 +515,7 @@ class StubbingTransformer(BaseTransformer):
             # Special workaround for Self for now. Self is only in 3.11, and many people aren't using 3.11 yet. So we have to introduce 
             # typevars instead for now. There's a slight risk of a name collision here.
             if rtntyp == 'Self':
-                containing_class = context.split('.')[0]
+                containing_class = context.partition('.')[0]
                 if name == '__new__':
                     # Don't use Self here anyway
                     rtntyp = containing_class
@@ -651,11 +651,11 @@ def make_imports_relative(m: str, module: str, fname: str) -> str:
 
 def _stub_python_module(m: str, fname: str, source: str, state: State, strip_defaults: bool = False) -> str|None:
     try:
-        cstree = cst.parse_module(source)
+        cstree = parse_module_cached(source)
     except Exception as e:
         return None
 
-    tlmodule = m.split('.')[0]
+    tlmodule = m.partition('.')[0]
     patcher = StubbingTransformer(tlmodule, m, fname, state, strip_defaults=strip_defaults)
     modified = cstree.visit(patcher)
     modified_code = modified.code
@@ -727,15 +727,16 @@ def _stub_python_module(m: str, fname: str, source: str, state: State, strip_def
         return code
 
 
-def stub_module(module_name: str, strip_defaults: bool = False, 
-                skip_analysis: bool = False, stub_folder: str = 'typings') -> None:
+def stub_module(module_name: str, strip_defaults: bool = False,
+                skip_analysis: bool = False, stub_folder: str = 'typings',
+                trace_folder: str = 'tracing') -> None:
     logging.basicConfig(level=logging.WARNING)
     top_level_module_name = get_top_level_module_name(module_name)
     if skip_analysis:
         state = State(None, load_docstrings(top_level_module_name), \
                       load_type_maps(top_level_module_name), {}, {}, {}, {})
-    else:   
-        state = analyze_module(module_name)
+    else:
+        state = analyze_module(module_name, trace_folder=trace_folder)
     if state is not None:
         state.creturns.update(load_map(top_level_module_name, 'creturns'))
         creturns = f'analysis/{top_level_module_name}.creturns.map.missing'
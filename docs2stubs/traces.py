@@ -14,6 +14,7 @@ from typing import (
 # This is duplicated in the tracing directory, so need to refactor
 # at some point to avoid that.
 
+from functools import lru_cache
 from inspect import Signature
 import re
 import sqlite3
@@ -26,10 +27,6 @@ from monkeytype.tracing import CallTrace
 from monkeytype.stubs import build_module_stubs_from_traces
 from monkeytype.typing import shrink_types
 
-import numpy as np
-import pandas as pd
-import scipy
-
 from .utils import get_top_level_module_name
 
 
@@ -212,16 +209,41 @@ def simplify_types(ts: set[Type]):
 
 
 
-_qualname = re.compile(r'[A-Za-z_\.]*\.([A-Za-z_][A-Za-z_0-9]*)')
-
-
 def _adjust_name(name: str) -> str:
     if name in ['List', 'Dict', 'Tuple', 'Set']:
         return name.lower()
     return name
 
 
+# Sets of concrete types that map to our synthetic type names, so that
+# _get_repr does O(1) membership tests instead of a chain of ==
+# comparisons per leaf. numpy, pandas and scipy are only needed here, and
+# importing them (scipy especially) is slow, so the sets are populated
+# lazily on the first _get_repr call rather than at module import time.
+_ARRAYLIKE_TYPES: frozenset = frozenset()
+_MATRIXLIKE_TYPES: frozenset = frozenset()
+_INT_TYPES: frozenset = frozenset()
+_FLOAT_TYPES: frozenset = frozenset()
+
+
+def _init_type_sets() -> None:
+    global _ARRAYLIKE_TYPES, _MATRIXLIKE_TYPES, _INT_TYPES, _FLOAT_TYPES
+    import numpy as np
+    import pandas as pd
+    import scipy.sparse
+    _ARRAYLIKE_TYPES = frozenset([np.ndarray, pd.Series])
+    _MATRIXLIKE_TYPES = frozenset([np.ndarray, pd.DataFrame, scipy.sparse.spmatrix,
+                                   scipy.sparse.csr_matrix, scipy.sparse.csc_matrix])
+    _INT_TYPES = frozenset([np.int64, np.uint64])
+    _FLOAT_TYPES = frozenset([np.float32, np.float64])
+
+
+# The same types recur massively across counter entries, so memoize.
+# Type objects and typing aliases are hashable so they make fine keys.
+@lru_cache(maxsize=8192)
 def _get_repr(tlmodule: str, typ, arraylike: bool = False, matrixlike: bool=False) -> str:
+    if not _INT_TYPES:
+        _init_type_sets()
     if isinstance(typ, UnionType):
         components = []
         for a in typ.__args__:
@@ -238,13 +260,13 @@ def _get_repr(tlmodule: str, typ, arraylike: bool = False, matrixlike: bool=Fals
                 t = _get_repr(tlmodule, a)
                 components.append(t)
             typ = f'{_adjust_name(typ._name)}[{", ".join(components)}]'
-    elif arraylike and (typ == np.ndarray or typ == pd.Series):
+    elif arraylike and typ in _ARRAYLIKE_TYPES:
         typ = 'ArrayLike'
-    elif matrixlike and typ in [np.ndarray, pd.DataFrame, scipy.sparse.spmatrix, scipy.sparse.csr_matrix, scipy.sparse.csc_matrix]: # type: ignore 
+    elif matrixlike and typ in _MATRIXLIKE_TYPES:
         typ = 'MatrixLike'
-    elif typ == np.int64 or typ == np.uint64:
+    elif typ in _INT_TYPES:
         typ =  'Int'
-    elif typ == np.float32 or typ == np.float64:
+    elif typ in _FLOAT_TYPES:
         typ = 'Float'
     else:
         typ = _type_repr(typ).replace('NoneType', 'None')
@@ -257,9 +279,21 @@ qualname_re = re.compile(r'[A-Za-z_][A-Za-z0-9_\.]*[A-Za-z0-9_]*')
 
 def combine_types(tlmodule: str, context: str, tracetyp: type|None = None, doctyp: str|None = None,
                    valtyp: str|None = None) -> tuple[str, set[tuple[str, str]]]:
+    # context is not part of the result (it only appears in the commented-out
+    # Self handling below), so it is kept out of the memoization key; with it
+    # the cache would never hit as contexts are unique.
+    return _combine_types(tlmodule, tracetyp, doctyp, valtyp)
 
-    arraylike = doctyp is not None and doctyp.find('ArrayLike') >= 0
-    matrixlike = doctyp is not None and doctyp.find('MatrixLike') >= 0
+
+# The same (tracetyp, doctyp, valtyp) combinations recur across many
+# functions, so memoize. Callers only read the returned imports set, so
+# sharing it between cache hits is safe.
+@lru_cache(maxsize=8192)
+def _combine_types(tlmodule: str, tracetyp: type|None, doctyp: str|None,
+                   valtyp: str|None) -> tuple[str, set[tuple[str, str]]]:
+
+    arraylike = doctyp is not None and 'ArrayLike' in doctyp
+    matrixlike = doctyp is not None and 'MatrixLike' in doctyp
     imports = set()
     components = []
 
@@ -395,10 +429,12 @@ def combine_types(tlmodule: str, context: str, tracetyp: type|None = None, docty
     elif has_str or has_literal:
        newc.append('str')
 
-    components = set()
-    for c in set(newc):
+    # dict.fromkeys dedups like a set but keeps insertion order, so the
+    # resulting union is deterministic and downstream map files diff cleanly.
+    components = {}
+    for c in dict.fromkeys(newc):
         if c.startswith('Literal['):
-            components.add(c)
+            components[c] = None
             continue
         # Now go through all the qualnames in the types, and replace with last part,
         # adding an import to the needed imports.
@@ -408,7 +444,7 @@ def combine_types(tlmodule: str, context: str, tracetyp: type|None = None, docty
                 parts = x.split('.')
                 mod = '.'.join(parts[:-1])
                 name = parts[-1]
-                imports.add((name, mod)) 
+                imports.add((name, mod))
             elif x in [
                 'ArrayLike',
                 'MatrixLike',
@@ -417,11 +453,11 @@ def combine_types(tlmodule: str, context: str, tracetyp: type|None = None, docty
                 'Int',
                 'Float',
                 'Scalar',
-                'Color'             
+                'Color'
             ]:
                 imports.add((x, typing))
         # Remove module qualifiers from qualnames now we have the import data we need
-        components.add(qualname_re.sub(lambda m: m.group()[m.group().rfind('.')+1:], c))
-            
+        components[qualname_re.sub(lambda m: m.group()[m.group().rfind('.')+1:], c)] = None
+
     result = '|'.join(components)
     return result, imports
@@ -73,16 +73,11 @@ def sanitize_shape(s: str) -> str:
         return s
 
 
-_trivial_cache = {}
-
-
+@lru_cache(maxsize=None)
 def is_trivial(s, modname: str):
-    key = f'{modname}.{s}'
-    if key in _trivial_cache:
-        return _trivial_cache[key]
-    rtn = _is_trivial(s, modname)
-    _trivial_cache[key] = rtn
-    return rtn
+    # lru_cache hashes the argument tuple directly, where the old manual
+    # dict cache built an f-string key on every call, hit or miss.
+    return _is_trivial(s, modname)
 
 
 def _is_trivial(s, modname: str):
@@ -206,20 +201,13 @@ def _is_string(s) -> bool:
     return True
 
 
-_normalize_cache = {}
-
-
+@lru_cache(maxsize=None)
 def normalize_type(s: str, modname: str|None = None, is_param: bool = False) -> str|None:
     try:
-        key = f'{modname}.{s}?{is_param}'
-        if key in _normalize_cache:
-            return _normalize_cache[key]
-        rtn = parse_type(sanitize_shape(s), modname, is_param)
-        _normalize_cache[key] = rtn
-        return rtn
+        return parse_type(sanitize_shape(s), modname, is_param)
     except Exception as e:
         return None
-    
+
 
 def check_normalizer(typ: str, is_param: bool, m: str|None=None):
     if m is None:
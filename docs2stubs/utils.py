@@ -1,4 +1,5 @@
 from collections import Counter
+from functools import lru_cache
 import glob
 import importlib
 import inspect
@@ -121,47 +122,85 @@ def save_result(target: str, result: str) -> None:
         f.write(result)
 
 
+@lru_cache(maxsize=None)
+def _submodule_name(fname: str) -> str:
+    # rpartition is a single C-level scan and needs no +1 correction;
+    # cached as this is called many times per file for the same fname.
+    return fname.rpartition('/')[2][:-3]
+
+
 def get_top_level_obj(mod: ModuleType, fname: str, oname: str):
     try:
         return mod.__dict__[oname]
     except KeyError:
         try:
-            submod = fname[fname.rfind('/')+1:-3]
-            return mod.__dict__[submod].__dict__[oname]
+            return mod.__dict__[_submodule_name(fname)].__dict__[oname]
         except Exception:
             logging.error(f'{fname}: Could not get obj for {oname}')
             return None
 
 
-def analyze_object(obj, context: str, parser, 
-                    counters: Sections[Counter[str]], 
+# Many docstrings repeat verbatim across a class hierarchy (base classes,
+# mixins, inherited methods), so cache both the docstring lookup and the
+# parse. The parsed Sections are only ever read by callers so sharing the
+# result between cache hits is safe.
+
+_raw_getdoc = lru_cache(maxsize=4096)(inspect.getdoc)
+
+
+def _cached_getdoc(obj) -> str|None:
+    try:
+        return _raw_getdoc(obj)
+    except TypeError:
+        # Unhashable object; fall back to the uncached lookup.
+        return inspect.getdoc(obj)
+
+
+# Parse output depends only on the docstring text, so one shared parser
+# with the text as the cache key lets repeats across files hit the cache.
+# Created lazily as importing NumpyDocstringParser at the top of this
+# module would be circular.
+_parser = None
+
+
+@lru_cache(maxsize=4096)
+def _cached_parse(doc: str) -> Sections:
+    global _parser
+    if _parser is None:
+        from .docstring_parser import NumpyDocstringParser
+        _parser = NumpyDocstringParser()
+    return _parser.parse(doc)
+
+
+def analyze_object(obj, context: str,
+                    type_buffers: Sections[list[str]],
                     attr_types: dict[str, str]|None=None) -> Sections[dict[str,str]|None]:
     # This gets the docstring for a class, function or method, parses it, and returns
-    # the result. It also updates the counters for the types of docstrings found, and
-    # adds entries for encountered class  attributes to the attr_types dictionary.
+    # the result. It also buffers the types of docstrings found (the caller counts
+    # them in one batch at the end of the module), and adds entries for encountered
+    # class attributes to the attr_types dictionary.
 
     doc = None
     rtn = Sections(params=None, returns=None, attrs=None)
 
-    # Get and parse the docstring for the object. This uses inspect and so doesn't work for 
+    # Get and parse the docstring for the object. This uses inspect and so doesn't work for
     # attributes that are documented in the class docstring. We handle those at the end.
     if obj:
-        doc = inspect.getdoc(obj)
+        doc = _cached_getdoc(obj)
         if doc:
-            rtn = parser.parse(doc)
+            rtn = _cached_parse(doc)
     
-    # Update the counters for the docstrings we found
-    for section, counter in zip(rtn, counters):
+    # Buffer the docstring types we found; one Counter.update over the
+    # collected lists at module end beats per-object counter updates.
+    for section, buffer in zip(rtn, type_buffers):
         if section:
-            section = cast(dict[str,str], section)
-            counter = cast(Counter[str], counter)
-            for typ in section.values():
-                counter[typ] += 1
+            cast(list, buffer).extend(cast(dict[str,str], section).values())
 
     # If we have attribute docstrings, we fake up the contexts and save them here.
     if rtn.attrs and attr_types:
+        prefix = context + '.'
         for k, v in rtn.attrs.items():
-            attr_types[f'{context}.{k}'] = v
+            attr_types[prefix + k] = v
 
     return rtn # type: ignore
 